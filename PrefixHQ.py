@@ -3,23 +3,40 @@ import sys
 import os
 import shutil
 import json
+import sqlite3
+import mmap
 import subprocess
 import platform
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote
 import re
 import struct
+import time
 import zlib
+import functools
+import types
+import threading
+import collections
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QMessageBox, QInputDialog, QProgressBar,
     QScrollArea, QFrame, QLineEdit, QLayout, QSizePolicy, QMenu, QStyle,
-    QFileDialog, QDialog, QDialogButtonBox
+    QFileDialog, QDialog, QDialogButtonBox, QWidgetItem
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QPoint, QRect, QTimer, QUrl
-from PyQt6.QtGui import QIcon, QColor, QBrush, QPixmap, QAction, QPainter, QPainterPath, QDesktopServices, QCursor
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, pyqtSignal, QSize, QPoint, QRect, QTimer, QUrl, QFile, QIODevice, QBuffer
+from PyQt6.QtGui import QIcon, QColor, QBrush, QPixmap, QPixmapCache, QImage, QImageReader, QImageWriter, QAction, QPainter, QPainterPath, QDesktopServices, QCursor
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkDiskCache
+
+try:
+    import orjson # Optional, faster DB (de)serialization
+except ImportError:
+    orjson = None
 
 # --- CRITICAL CONFIGURATION ---
 os.environ["REQUESTS_CA_BUNDLE"] = "/etc/ssl/certs/ca-certificates.crt"
@@ -48,9 +65,47 @@ STEAMGRIDDB_SEARCH_URL = "https://www.steamgriddb.com/search/grids?term={term}"
 
 CONFIG_DIR = Path.home() / ".config/PrefixHQ"
 DB_FILE = CONFIG_DIR / "prefix_db.json"
+CACHE_DB_FILE = CONFIG_DIR / "cache.sqlite3"
 IMG_CACHE_DIR = CONFIG_DIR / "cache"
+HTTP_CACHE_DIR = IMG_CACHE_DIR / "http"
+
+VERBOSE = bool(os.environ.get("PREFIXHQ_DEBUG")) # Set PREFIXHQ_DEBUG=1 for DEBUG output
+IS_FROZEN = getattr(sys, 'frozen', False) # PyInstaller build
+SYSTEM = platform.system()
 
 IGNORE_APPIDS = {"0", "228980", "1070560", "1391110", "1628350"}
+NAME_FETCH_WORKERS = 16
+API_CACHE_TTL = 30 * 86400 # Seconds before a cached Steam name is fetched again
+ACF_HEAD_SIZE = 4096 # Bytes; "appid" and "name" sit at the top of the AppState block
+DB_FLUSH_DELAY_MS = 2000 # Coalesces bursts of edits into one DB write
+HTTP_CACHE_SIZE = 200 * 1024 * 1024
+IMG_CACHE_BYTES = 150 * 1024 * 1024 # Covers and thumbnails on disk, see DataManager.trim_image_cache
+NETWORK_MAX_IN_FLIGHT = 16
+NETWORK_TIMEOUT_MS = 5000 # A stalled transfer is aborted so it stops holding an in-flight slot
+NETWORK_RETRIES = 2 # Extra attempts after a transient error, before falling back
+NETWORK_RETRY_DELAY_MS = 500 # Doubled per attempt, capped at NETWORK_RETRY_MAX_DELAY_MS
+NETWORK_RETRY_MAX_DELAY_MS = 5000
+PROGRESS_INTERVAL_MS = 100 # Status label refresh cap while scanning
+FILTER_DELAY_MS = 120 # Typing pause before the search filter runs
+PIX_CACHE_BYTES = 128 * 1024 * 1024 # Decoded covers kept in memory across refreshes and view toggles
+RMTREE_WORKERS = 8
+RMTREE_SPLIT_DEPTH = 3 # Deep enough to split pfx/drive_c/* across workers
+GRID_IMAGE_SIZE = QSize(220, 105)
+LIST_IMAGE_SIZE = QSize(100, 50)
+# Thumbnails are lossy WebP when Qt's image plugin has it (a fraction of the PNG size)
+THUMB_FORMAT = "webp" if b"webp" in QImageWriter.supportedImageFormats() else "png"
+THUMB_QUALITY = 85
+
+# Shared HTTP session: keeps the TLS connection to the Steam store alive between lookups
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=NAME_FETCH_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+_RE_ACF = re.compile(rb'"(appid|name)"\s+"([^"]+)"')
+_RE_PATH = re.compile(rb'"path"\s+"((?:[^"\\]|\\.)*)"') # Escape-aware, no lazy backtracking
 
 # --- STYLESHEET ---
 DARK_THEME = """
@@ -161,6 +216,21 @@ QLabel#CardStatus {
     font-size: 10px;
     color: #8f98a0;
 }
+QLabel#CardStatus[installed="true"] {
+    color: #a3cf06;
+}
+QLabel#CardStatus[installed="false"] {
+    color: #d9534f;
+}
+QLabel#CardImage {
+    background-color: #0d1015;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+}
+QLabel#ListImage {
+    background-color: #0d1015;
+    border-radius: 4px;
+}
 QLabel#StatusFooter {
     font-size: 12px;
     color: #8f98a0;
@@ -173,53 +243,241 @@ QDialog {
 """
 
 class DataManager:
+    # Last manifest scan, keyed by the (path, mtime_ns, size) of every .acf file
+    _installed_cache = {"fp": None, "games": {}}
+    # Parsed prefix DB; the file is only read once per session
+    _db_cache = None
+
     @staticmethod
     def init_storage():
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         IMG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         if not DB_FILE.exists():
-            DataManager.save_db({"custom_names": {}, "custom_status": {}, "api_cache": {}})
+            DataManager.save_db({"custom_names": {}, "custom_status": {}})
+
+        # One-time move of the legacy JSON api_cache into the SQLite cache
+        db = DataManager.load_db()
+        if "api_cache" in db and DataManager._migrate_api_cache(db["api_cache"]):
+            del db["api_cache"]
+            DataManager.save_db(db)
 
     @staticmethod
     def load_db():
-        try:
-            with open(DB_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {"custom_names": {}, "custom_status": {}, "api_cache": {}}
+        if DataManager._db_cache is None:
+            try:
+                if orjson:
+                    DataManager._db_cache = orjson.loads(DB_FILE.read_bytes())
+                else:
+                    with open(DB_FILE, "r", encoding="utf-8") as f:
+                        DataManager._db_cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                DataManager._db_cache = {"custom_names": {}, "custom_status": {}}
+        return DataManager._db_cache
 
     @staticmethod
     def save_db(data):
+        DataManager._db_cache = data
+
+        # Write to a temp file and swap it in, so a crash never leaves a torn DB
+        tmp_file = DB_FILE.with_suffix(".json.tmp")
         try:
-            with open(DB_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            if orjson:
+                tmp_file.write_bytes(orjson.dumps(data))
+            else:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_file, DB_FILE)
         except Exception as e:
             print(f"Error saving DB: {e}")
 
+    @staticmethod
+    def connect_cache():
+        # A connection per call: the scan worker and the GUI thread each use their own
+        conn = sqlite3.connect(CACHE_DB_FILE, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS api_cache ("
+            "appid TEXT PRIMARY KEY, name TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+        return conn
+
+    @staticmethod
+    def load_api_names():
+        # appid -> (name, fetched_at) for every entry; expired ones are still the best name
+        # there is until a refresh succeeds, so telling them apart is left to the caller
+        try:
+            with closing(DataManager.connect_cache()) as conn:
+                rows = conn.execute("SELECT appid, name, fetched_at FROM api_cache")
+                return {appid: (name, fetched_at) for appid, name, fetched_at in rows}
+        except sqlite3.Error as e:
+            print(f"Error reading API cache: {e}")
+            return {}
+
+    @staticmethod
+    def save_api_names(names):
+        now = int(time.time())
+        return DataManager._write_api_cache([(appid, name, now) for appid, name in names.items()])
+
+    @staticmethod
+    def _migrate_api_cache(legacy):
+        now = int(time.time())
+        rows = []
+        for appid, entry in legacy.items():
+            if isinstance(entry, str):
+                rows.append((appid, entry, now))
+            elif isinstance(entry, dict) and entry.get("name"):
+                rows.append((appid, entry["name"], entry.get("ts", now)))
+        return DataManager._write_api_cache(rows)
+
+    @staticmethod
+    def _write_api_cache(rows):
+        try:
+            with closing(DataManager.connect_cache()) as conn:
+                conn.execute("BEGIN")
+                conn.executemany("INSERT OR REPLACE INTO api_cache VALUES (?, ?, ?)", rows)
+                conn.execute("COMMIT")
+            return True
+        except sqlite3.Error as e:
+            print(f"Error writing API cache: {e}")
+            return False
+
+    @staticmethod
+    def trim_image_cache(in_use, budget=IMG_CACHE_BYTES):
+        # A cover and its thumbnails are evicted together. Covers of prefixes that are
+        # still around go last; otherwise the biggest age * size goes first (mtime is
+        # bumped whenever a file is loaded, so it tracks last use)
+        groups = {} # appid -> [bytes, last used, paths]
+        total = 0
+        try:
+            with os.scandir(IMG_CACHE_DIR) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False): continue
+                    st = entry.stat()
+                    group = groups.setdefault(entry.name.split(".", 1)[0].split("_", 1)[0], [0, 0, []])
+                    group[0] += st.st_size
+                    group[1] = max(group[1], st.st_mtime)
+                    group[2].append(entry.path)
+                    total += st.st_size
+        except OSError:
+            return
+
+        if total <= budget: return
+
+        now = time.time()
+        victims = sorted(groups.items(), key=lambda g: (g[0] in in_use, -(now - g[1][1]) * g[1][0]))
+        for _, (size, _, paths) in victims:
+            if total <= budget: break
+            for path in paths:
+                try: os.unlink(path)
+                except OSError: pass
+            total -= size
+
+    @staticmethod
+    def get_installed_games(libraries):
+        # Libraries usually sit on different disks, so each one gets its own worker
+        with ThreadPoolExecutor(max_workers=max(1, len(libraries))) as executor:
+            per_library = list(executor.map(DataManager._list_manifests, libraries))
+
+            cache = DataManager._installed_cache
+            fingerprint = frozenset(m for manifests in per_library for m in manifests)
+            if fingerprint == cache["fp"]:
+                return dict(cache["games"])
+
+            installed_games = {}
+            for games in executor.map(DataManager._parse_manifests, per_library):
+                installed_games.update(games)
+
+        cache["fp"] = fingerprint
+        cache["games"] = installed_games
+        return dict(installed_games)
+
+    @staticmethod
+    def _list_manifests(lib_path):
+        manifests = []
+        try:
+            with os.scandir(lib_path / "steamapps") as it:
+                for entry in it:
+                    if entry.name.endswith(".acf") and entry.is_file():
+                        st = entry.stat()
+                        manifests.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError: pass
+        return manifests
+
+    @staticmethod
+    def _parse_manifests(manifests):
+        games = {}
+        for path, _, _ in manifests:
+            try:
+                appid, name = DataManager.parse_acf(path)
+                if appid:
+                    games[appid] = name
+            except: continue
+        return games
+
+    @staticmethod
+    def parse_acf(acf_path):
+        # Matched on raw bytes; only the two captured values are ever decoded
+        with open(acf_path, "rb") as f:
+            content = f.read(ACF_HEAD_SIZE)
+            fields = DataManager._match_acf_fields(content)
+            while len(fields) < 2:
+                # Unusually large header: double the window until both fields show up,
+                # so the depot lists further down are still never read
+                chunk = f.read(len(content))
+                if not chunk: break
+                content += chunk
+                fields = DataManager._match_acf_fields(content)
+
+        appid = fields.get(b"appid")
+        if appid is None:
+            return None, None
+        appid = appid.decode("utf-8", "ignore")
+        name = fields.get(b"name")
+        return appid, name.decode("utf-8", "ignore") if name else f"AppID {appid}"
+
+    @staticmethod
+    def _match_acf_fields(content):
+        fields = {}
+        for m in _RE_ACF.finditer(content):
+            fields.setdefault(m.group(1), m.group(2))
+            if len(fields) == 2: break
+        return fields
+
     @staticmethod
     def get_steam_libraries():
         libraries = []
+        seen = set() # Resolved paths, so symlinked duplicates are caught too
         if STEAM_BASE.exists():
-            libraries.append(STEAM_BASE)
+            libraries.append(STEAM_BASE.resolve())
+            seen.add(libraries[0])
 
         vdf_path = STEAM_APPS / "libraryfolders.vdf"
         if vdf_path.exists():
             try:
-                with open(vdf_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                matches = re.findall(r'"path"\s+"(.*?)"', content)
-                for path_str in matches:
-                    path_str = path_str.replace("\\\\", "\\")
-                    lib_path = Path(path_str)
-
-                    if lib_path.exists() and lib_path not in libraries:
-                        libraries.append(lib_path)
+                # Regex straight over the mapped bytes, one match at a time; only the captured paths get decoded
+                with open(vdf_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return libraries # mmap refuses empty files, and there is nothing to add
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for m in _RE_PATH.finditer(mm):
+                            path_str = m.group(1).decode("utf-8").replace("\\\\", "\\")
+                            lib_path = Path(path_str)
+
+                            if lib_path.exists():
+                                lib_path = lib_path.resolve()
+                                if lib_path not in seen:
+                                    seen.add(lib_path)
+                                    libraries.append(lib_path)
             except Exception as e:
                 print(f"Error parsing libraryfolders.vdf: {e}")
 
         return libraries
 
 class NonSteamManager:
+    # shortcuts.vdf path -> ((mtime_ns, size), appid -> name) from the last parse
+    _shortcuts_cache = {}
+
     @staticmethod
     def get_non_steam_ids(steam_root):
         mapping = {}
@@ -227,18 +485,28 @@ class NonSteamManager:
         if not userdata.exists():
             return mapping
 
-        print(f"DEBUG: Checking userdata in {userdata}")
+        if VERBOSE: print(f"DEBUG: Checking userdata in {userdata}")
 
         for user_dir in userdata.iterdir():
             shortcuts_path = user_dir / "config" / "shortcuts.vdf"
             if shortcuts_path.exists():
-                print(f"DEBUG: Found shortcuts.vdf at {shortcuts_path}")
+                if VERBOSE: print(f"DEBUG: Found shortcuts.vdf at {shortcuts_path}")
                 try:
+                    st = shortcuts_path.stat()
+                    file_key = (st.st_mtime_ns, st.st_size)
+                    cached = NonSteamManager._shortcuts_cache.get(shortcuts_path)
+                    if cached and cached[0] == file_key:
+                        mapping.update(cached[1])
+                        continue
+
                     with open(shortcuts_path, "rb") as f:
                         data = f.read()
 
+                    found = {}
+
                     items = NonSteamManager.parse_binary_vdf(data)
-                    print(f"DEBUG: Parsed {len(items)} items from VDF")
+                    # Collected and printed once per file instead of once per shortcut
+                    debug_lines = [f"DEBUG: Parsed {len(items)} items from VDF"] if VERBOSE else None
 
                     for item in items:
                         app_name = item.get("AppName", "")
@@ -247,16 +515,20 @@ class NonSteamManager:
                         raw_id = item.get("appid")
                         if raw_id is not None:
                             generated_id = raw_id & 0xffffffff
-                            mapping[str(generated_id)] = app_name
-                            print(f"DEBUG: Mapped (Explicit) {generated_id} -> {app_name}")
+                            found[str(generated_id)] = app_name
+                            if VERBOSE: debug_lines.append(f"DEBUG: Mapped (Explicit) {generated_id} -> {app_name}")
 
                         if app_name and exe_path:
-                            crc_input = (exe_path + app_name).encode("utf-8")
-                            crc = zlib.crc32(crc_input) & 0xffffffff
+                            # crc32(exe + name), chained so the concatenation is never built
+                            crc = zlib.crc32(app_name.encode("utf-8"), zlib.crc32(exe_path.encode("utf-8")))
                             gen_id = crc | 0x80000000
-                            mapping[str(gen_id)] = app_name
+                            found[str(gen_id)] = app_name
+                            if VERBOSE: debug_lines.append(f"DEBUG: Mapped (Calculated) {gen_id} -> {app_name}")
 
-                            print(f"DEBUG: Mapped (Calculated) {gen_id} -> {app_name}")
+                    if VERBOSE: print("\n".join(debug_lines))
+
+                    NonSteamManager._shortcuts_cache[shortcuts_path] = (file_key, found)
+                    mapping.update(found)
 
                 except Exception as e:
                     print(f"Error parsing shortcuts.vdf at {shortcuts_path}: {e}")
@@ -272,36 +544,49 @@ class NonSteamManager:
             return s, end + 1
 
         def parse_map(d, p):
-            res = {}
-            while p < len(d):
+            # Nested maps are walked with an explicit stack instead of recursion.
+            # Leaving a map (0x08 or a malformed entry) pops back to its parent.
+            root = {}
+            stack = [root]
+            size = len(d)
+            find = d.find
+            unpack_from = struct.unpack_from
+
+            while stack and p < size:
+                res = stack[-1]
                 type_byte = d[p]
                 p += 1
 
                 if type_byte == 0x08:
-                    return res, p
+                    stack.pop()
+                    continue
 
-                if p >= len(d): break
+                if p >= size: break
 
-                try:
-                    key, p = read_string(d, p)
-                except ValueError:
-                    break
+                end = find(b'\x00', p)
+                if end == -1:
+                    stack.pop()
+                    continue
+                key = d[p:end].decode('utf-8', 'replace')
+                p = end + 1
 
                 if type_byte == 0x00:
-                    sub_map, p = parse_map(d, p)
+                    sub_map = {}
                     res[key] = sub_map
+                    stack.append(sub_map)
                 elif type_byte == 0x01:
                     val, p = read_string(d, p)
                     res[key] = val
                 elif type_byte == 0x02:
-                    if p + 4 > len(d): break
-                    val = struct.unpack('<I', d[p:p+4])[0] # Unsigned
+                    if p + 4 > size:
+                        stack.pop()
+                        continue
+                    res[key] = unpack_from('<I', d, p)[0] # Unsigned
                     p += 4
-                    res[key] = val
                 else:
-                    print(f"DEBUG: Unknown type {hex(type_byte)} at {p-1}")
-                    break
-            return res, p
+                    if VERBOSE: print(f"DEBUG: Unknown type {hex(type_byte)} at {p-1}")
+                    stack.pop()
+            return root, p
 
         items = []
         ptr = 0
@@ -325,13 +610,15 @@ class NonSteamManager:
                     if isinstance(v, dict):
                         items.append(v)
             except Exception as e:
-                print(f"DEBUG: Fallback parse failed: {e}")
+                if VERBOSE: print(f"DEBUG: Fallback parse failed: {e}")
 
         return items
 
 class SystemUtils:
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_clean_environment():
+        # Computed once per session; read-only since every launch shares it
         clean_env = os.environ.copy()
         vars_to_remove = [
             "LD_LIBRARY_PATH", "OPENSSL_MODULES", "OPENSSL_CONF",
@@ -350,25 +637,25 @@ class SystemUtils:
 
         clean_env["QT_QPA_PLATFORM"] = "xcb"
         clean_env.pop("QTWEBENGINEPROCESS_PATH", None)
-        return clean_env
+        return types.MappingProxyType(clean_env)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_default_file_manager():
+        # Returns (name, executable path); detected once per session
         try:
             cmd = ["xdg-mime", "query", "default", "inode/directory"]
             result = subprocess.check_output(cmd).decode().strip()
             if result:
-                if "nautilus" in result.lower(): return "nautilus"
-                if "dolphin" in result.lower(): return "dolphin"
-                if "nemo" in result.lower(): return "nemo"
-                if "thunar" in result.lower(): return "thunar"
-                if "pcmanfm" in result.lower(): return "pcmanfm"
+                for fm in ("nautilus", "dolphin", "nemo", "thunar", "pcmanfm"):
+                    if fm in result.lower(): return fm, shutil.which(fm)
         except Exception:
             pass
         common_fms = ["dolphin", "nautilus", "nemo", "thunar", "pcmanfm", "caja"]
         for fm in common_fms:
-            if shutil.which(fm): return fm
-        return None
+            fm_path = shutil.which(fm)
+            if fm_path: return fm, fm_path
+        return None, None
 
     @staticmethod
     def open_with_file_manager(path):
@@ -377,11 +664,11 @@ class SystemUtils:
             return False
 
         clean_env = SystemUtils._get_clean_environment()
-        fm = SystemUtils.get_default_file_manager()
+        _, fm_path = SystemUtils.get_default_file_manager()
 
-        if fm:
+        if fm_path:
             try:
-                subprocess.Popen([fm, path], env=clean_env)
+                subprocess.Popen([fm_path, path], env=clean_env)
                 return True
             except:
                 pass
@@ -392,14 +679,43 @@ class SystemUtils:
         except:
             return False
 
+    @staticmethod
+    def remove_tree(path):
+        # Same result as shutil.rmtree, but the subtrees below RMTREE_SPLIT_DEPTH
+        # are removed in parallel to keep several unlink/rmdir calls in flight
+        if os.path.islink(path):
+            raise OSError(f"Cannot remove symbolic link as a tree: {path}")
+
+        emptied = [] # Removed bottom-up once their subtrees are gone
+        frontier = [str(path)]
+        for _ in range(RMTREE_SPLIT_DEPTH):
+            next_frontier = []
+            for d in frontier:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            next_frontier.append(entry.path)
+                        else:
+                            os.unlink(entry.path)
+            emptied.extend(frontier)
+            frontier = next_frontier
+
+        if frontier:
+            with ThreadPoolExecutor(max_workers=min(RMTREE_WORKERS, len(frontier))) as executor:
+                for future in [executor.submit(shutil.rmtree, d) for d in frontier]:
+                    future.result()
+
+        for d in reversed(emptied):
+            os.rmdir(d)
+
     @staticmethod
     def open_url(url):
-        if not getattr(sys, 'frozen', False):
+        if not IS_FROZEN:
             QDesktopServices.openUrl(QUrl(url))
             return True
 
         clean_env = SystemUtils._get_clean_environment()
-        system = platform.system()
+        system = SYSTEM
 
         try:
             if system == 'Linux':
@@ -425,6 +741,9 @@ class FlowLayout(QLayout):
         self.h_spacing = h_spacing
         self.v_spacing = v_spacing
         self.items = []
+        # Rebuilt lazily after invalidate(): resizing alone keeps both
+        self._hints = None # (item, widget, width, height, size hint) per item
+        self._height_cache = None # (width, height) of the last heightForWidth
 
     def __del__(self):
         item = self.takeAt(0)
@@ -433,6 +752,7 @@ class FlowLayout(QLayout):
 
     def addItem(self, item):
         self.items.append(item)
+        self._hints = self._height_cache = None
 
     def count(self):
         return len(self.items)
@@ -444,6 +764,7 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.items):
+            self._hints = self._height_cache = None
             return self.items.pop(index)
         return None
 
@@ -454,7 +775,17 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        return self.do_layout(QRect(0, 0, width, 0), True)
+        cached = self._height_cache
+        if cached and cached[0] == width:
+            return cached[1]
+        height = self.do_layout(QRect(0, 0, width, 0), True)
+        self._height_cache = (width, height)
+        return height
+
+    def invalidate(self):
+        # Called by Qt when an item is shown/hidden or changes its size hint
+        self._hints = self._height_cache = None
+        super().invalidate()
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
@@ -470,33 +801,53 @@ class FlowLayout(QLayout):
         return size
 
     def do_layout(self, rect, test_only):
+        if self._hints is None:
+            self._hints = []
+            for item in self.items:
+                hint = item.sizeHint()
+                self._hints.append((item, item.widget(), hint.width(), hint.height(), hint))
+
         x, y = rect.x(), rect.y()
+        right = rect.right()
+        space_x = self.h_spacing
+        space_y = self.v_spacing
         line_height = 0
 
-        for item in self.items:
-            wid = item.widget()
-            space_x = self.h_spacing
-            space_y = self.v_spacing
-
-            if wid and not wid.isVisible():
+        for item, wid, w, h, hint in self._hints:
+            # isHidden() rather than isVisible(): the answer must not depend on
+            # whether the parent is shown yet, or the cached height goes stale
+            if wid and wid.isHidden():
                 continue
 
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
+            next_x = x + w + space_x
+            if next_x - space_x > right and line_height > 0:
                 x = rect.x()
                 y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+                next_x = x + w + space_x
                 line_height = 0
 
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), hint))
 
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            if h > line_height: line_height = h
 
         return y + line_height - rect.y()
 
 # --- CUSTOM WIDGETS ---
+_ICON_CACHE = {}
+
+def cached_icon(fallback, theme_name=None):
+    # Looked up once per session; QIcon is implicitly shared, so every button holds the same data
+    key = (theme_name, fallback)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = QIcon.fromTheme(theme_name) if theme_name else QIcon()
+        if icon.isNull():
+            icon = QApplication.style().standardIcon(fallback)
+        _ICON_CACHE[key] = icon
+    return icon
+
 class CoverDownloadDialog(QDialog):
     def __init__(self, game_name, parent=None):
         super().__init__(parent)
@@ -525,12 +876,51 @@ class CoverDownloadDialog(QDialog):
 
 # --- MIXIN FOR CONTEXT MENU (Shared between Grid and List) ---
 class GameCardMixin:
+    # Shared by GameCard and GameListItem; both set self.data, img_label and status_lbl
+    def setup_buttons(self, layout):
+        btn_open = QPushButton()
+        btn_open.setIcon(cached_icon(QStyle.StandardPixmap.SP_DirIcon))
+        btn_open.setToolTip("Open Directory")
+        btn_open.clicked.connect(lambda: self.window().action_open(self.data))
+
+        btn_rename = QPushButton()
+        btn_rename.setIcon(cached_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView, "document-edit"))
+        btn_rename.setToolTip("Rename")
+        btn_rename.clicked.connect(lambda: self.window().action_rename(self.data))
+
+        btn_delete = QPushButton()
+        btn_delete.setIcon(cached_icon(QStyle.StandardPixmap.SP_TrashIcon))
+        btn_delete.setObjectName("DeleteBtn")
+        btn_delete.setToolTip("Delete Prefix")
+        btn_delete.clicked.connect(lambda: self.window().action_delete(self.data))
+
+        layout.addWidget(btn_open)
+        layout.addWidget(btn_rename)
+        layout.addWidget(btn_delete)
+
+    def update_status_display(self):
+        status_text = "Installed" if self.data["is_installed"] else "Uninstalled"
+        self.status_lbl.setText(f"{status_text} • ID: {self.data['appid']}")
+        # Color comes from the QLabel#CardStatus[installed=...] theme rules
+        self.status_lbl.setProperty("installed", self.data["is_installed"])
+        self.status_lbl.style().unpolish(self.status_lbl)
+        self.status_lbl.style().polish(self.status_lbl)
+
+    def update_image(self, pixmap):
+        self.img_label.setPixmap(pixmap)
+
+    def update_data(self, data):
+        # Rebinds a reused card to a fresh scan result for the same appid
+        self.data = data
+        self.title_lbl.setText(data["name"])
+        self.update_status_display()
+
     def show_context_menu_common(self, pos):
         menu = QMenu(self)
 
         action_sgdb = QAction("Search on SteamGridDB", self)
         action_sgdb.triggered.connect(
-            lambda: SystemUtils.open_url(STEAMGRIDDB_SEARCH_URL.format(term=self.data["name"]))
+            lambda: SystemUtils.open_url(STEAMGRIDDB_SEARCH_URL.format(term=quote(self.data["name"])))
         )
 
         action_local = QAction("Load Cover from File...", self)
@@ -569,12 +959,11 @@ class GameCard(QFrame, GameCardMixin):
         self.img_label = QLabel()
         self.img_label.setFixedHeight(105)
         self.img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.img_label.setStyleSheet("background-color: #0d1015; border-top-left-radius: 8px; border-top-right-radius: 8px;")
-        self.img_label.setScaledContents(True)
+        self.img_label.setObjectName("CardImage")
         layout.addWidget(self.img_label)
 
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
+        # Plain nested layout: no container widget to create, style and lay out per card
+        content_layout = QVBoxLayout()
         content_layout.setContentsMargins(10, 8, 10, 8)
         content_layout.setSpacing(4)
 
@@ -594,42 +983,7 @@ class GameCard(QFrame, GameCardMixin):
         btn_layout.setSpacing(5)
         self.setup_buttons(btn_layout)
         content_layout.addLayout(btn_layout)
-        layout.addWidget(content_widget)
-
-    def setup_buttons(self, layout):
-        style = QApplication.style()
-
-        btn_open = QPushButton()
-        btn_open.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-        btn_open.setToolTip("Open Directory")
-        btn_open.clicked.connect(lambda: self.window().action_open(self.data))
-
-        btn_rename = QPushButton()
-        icon_edit = QIcon.fromTheme("document-edit")
-        if icon_edit.isNull():
-            icon_edit = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
-        btn_rename.setIcon(icon_edit)
-        btn_rename.setToolTip("Rename")
-        btn_rename.clicked.connect(lambda: self.window().action_rename(self.data))
-
-        btn_delete = QPushButton()
-        btn_delete.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
-        btn_delete.setObjectName("DeleteBtn")
-        btn_delete.setToolTip("Delete Prefix")
-        btn_delete.clicked.connect(lambda: self.window().action_delete(self.data))
-
-        layout.addWidget(btn_open)
-        layout.addWidget(btn_rename)
-        layout.addWidget(btn_delete)
-
-    def update_status_display(self):
-        status_text = "Installed" if self.data["is_installed"] else "Uninstalled"
-        status_color = "#a3cf06" if self.data["is_installed"] else "#d9534f"
-        self.status_lbl.setText(f"{status_text} • ID: {self.data['appid']}")
-        self.status_lbl.setStyleSheet(f"color: {status_color};")
-
-    def update_image(self, pixmap):
-        self.img_label.setPixmap(pixmap)
+        layout.addLayout(content_layout)
 
 class GameListItem(QFrame, GameCardMixin):
     def __init__(self, data, parent=None):
@@ -649,8 +1003,7 @@ class GameListItem(QFrame, GameCardMixin):
         self.img_label = QLabel()
         self.img_label.setFixedSize(100, 50)
         self.img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.img_label.setStyleSheet("background-color: #0d1015; border-radius: 4px;")
-        self.img_label.setScaledContents(True)
+        self.img_label.setObjectName("ListImage")
         layout.addWidget(self.img_label)
 
         # Info
@@ -675,137 +1028,197 @@ class GameListItem(QFrame, GameCardMixin):
         self.setup_buttons(btn_layout)
         layout.addLayout(btn_layout)
 
-    def setup_buttons(self, layout):
-        style = QApplication.style()
+class ImageLoadSignals(QObject):
+    loaded = pyqtSignal(str, QImage, bool) # appid, image (null on failure), read from disk cache
 
-        btn_open = QPushButton()
-        btn_open.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-        btn_open.setToolTip("Open Directory")
-        btn_open.clicked.connect(lambda: self.window().action_open(self.data))
+class ImageLoadTask(QRunnable):
+    # Decodes a cover off the GUI thread and scales it to the exact label size,
+    # so the full header.jpg never has to be held or rescaled by the widgets
+    def __init__(self, signals, appid, size, path=None, data=None):
+        super().__init__()
+        self.signals = signals
+        self.appid = appid
+        self.size = size
+        self.path = path
+        self.data = data
 
-        btn_rename = QPushButton()
-        icon_edit = QIcon.fromTheme("document-edit")
-        if icon_edit.isNull():
-            icon_edit = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
-        btn_rename.setIcon(icon_edit)
-        btn_rename.setToolTip("Rename")
-        btn_rename.clicked.connect(lambda: self.window().action_rename(self.data))
+    @staticmethod
+    def thumb_path(appid, size):
+        return IMG_CACHE_DIR / f"{appid}_{size.width()}x{size.height()}.{THUMB_FORMAT}"
 
-        btn_delete = QPushButton()
-        btn_delete.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
-        btn_delete.setObjectName("DeleteBtn")
-        btn_delete.setToolTip("Delete Prefix")
-        btn_delete.clicked.connect(lambda: self.window().action_delete(self.data))
+    @staticmethod
+    def _publish(path, write):
+        # write(tmp) fills a temp file that is then renamed over path, so a crash mid-write
+        # never leaves a torn image behind. Per-thread name: two tasks may write one appid.
+        # Dot-prefixed so no {appid}_* pattern or cache trim ever picks it up mid-write
+        tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def _write_data(self, tmp):
+        # QFile takes the QByteArray as is; a Python write would need a bytes copy first
+        f = QFile(str(tmp))
+        if not f.open(QIODevice.OpenModeFlag.WriteOnly) or f.write(self.data) != len(self.data):
+            raise OSError(f"Could not write {tmp}: {f.errorString()}")
+        f.close()
+
+    def _read(self):
+        # Returns (image, size stored in the file). The reader is told the target size up
+        # front, so JPEG covers are decoded straight at a fraction of their size (DCT scaling)
+        if self.data is None:
+            reader = QImageReader(str(self.path))
+        else:
+            buf = QBuffer()
+            buf.setData(self.data)
+            buf.open(QIODevice.OpenModeFlag.ReadOnly)
+            reader = QImageReader(buf)
+        src_size = reader.size()
+        if src_size.isValid() and src_size != self.size:
+            reader.setScaledSize(src_size.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+        return reader.read(), src_size
 
-        layout.addWidget(btn_open)
-        layout.addWidget(btn_rename)
-        layout.addWidget(btn_delete)
+    def run(self):
+        from_disk = self.data is None
+        image, src_size = self._read()
 
-    def update_status_display(self):
-        status_text = "Installed" if self.data["is_installed"] else "Uninstalled"
-        status_color = "#a3cf06" if self.data["is_installed"] else "#d9534f"
-        self.status_lbl.setText(f"{status_text} • ID: {self.data['appid']}")
-        self.status_lbl.setStyleSheet(f"color: {status_color};")
+        if image.isNull():
+            if from_disk:
+                self.path.unlink(missing_ok=True) # Corrupt cache entry, fetch it again
+            self.signals.loaded.emit(self.appid, QImage(), from_disk)
+            return
 
-    def update_image(self, pixmap):
-        self.img_label.setPixmap(pixmap)
+        try:
+            if from_disk:
+                os.utime(self.path) # Last-use time for DataManager.trim_image_cache
+            else:
+                # New cover: keep the original, drop thumbnails made from the old one
+                for fmt in ("webp", "png"): # PNG: thumbnails left by older versions
+                    for old in IMG_CACHE_DIR.glob(f"{self.appid}_*.{fmt}"):
+                        old.unlink(missing_ok=True)
+                ImageLoadTask._publish(IMG_CACHE_DIR / f"{self.appid}.jpg", self._write_data)
+
+            if src_size != self.size:
+                if image.size().scaled(self.size, Qt.AspectRatioMode.KeepAspectRatioByExpanding) != image.size():
+                    # Format without scaled reads, or no size in the header
+                    image = image.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                                         Qt.TransformationMode.SmoothTransformation)
+                x = (image.width() - self.size.width()) // 2
+                y = (image.height() - self.size.height()) // 2
+                image = image.copy(x, y, self.size.width(), self.size.height())
+
+                def save_thumb(tmp):
+                    if not image.save(str(tmp), THUMB_FORMAT, THUMB_QUALITY):
+                        raise OSError(f"Could not write {tmp}")
+                ImageLoadTask._publish(ImageLoadTask.thumb_path(self.appid, self.size), save_thumb)
+        except Exception as e:
+            print(f"Error caching cover for {self.appid}: {e}")
+
+        self.signals.loaded.emit(self.appid, image, from_disk)
+
+class RemoveTreeSignals(QObject):
+    done = pyqtSignal(str, bool, str) # appid, success, error message
+
+class RemoveTreeTask(QRunnable):
+    # Deletes a prefix off the GUI thread; the card is only dropped once this reports success
+    def __init__(self, signals, appid, path):
+        super().__init__()
+        self.signals = signals
+        self.appid = appid
+        self.path = path
+
+    def run(self):
+        try:
+            SystemUtils.remove_tree(self.path)
+            ok, err = True, ""
+        except Exception as e:
+            ok, err = False, str(e)
+        self.signals.done.emit(self.appid, ok, err)
 
 class ScanWorker(QThread):
     finished = pyqtSignal(list)
-    progress = pyqtSignal(str)
+    partial = pyqtSignal(list) # Disk results, sent before the Steam name lookups
+    names_resolved = pyqtSignal(dict) # appid -> (name sent in partial, fetched name)
+    progress = pyqtSignal(int, int, str) # Library index, library count, name; or 0, 0, message
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        # Snapshot on the GUI thread; the window owns the live DB
+        self.custom_names = dict(db.get("custom_names", {}))
+        self.custom_status = dict(db.get("custom_status", {}))
 
     def run(self):
-        self.progress.emit("Loading DB...")
-        db = DataManager.load_db()
-        custom_names = db.get("custom_names", {})
-        custom_status = db.get("custom_status", {})
-        api_cache = db.get("api_cache", {})
+        custom_names = self.custom_names
+        custom_status = self.custom_status
 
-        installed_games = {}
         prefixes = []
 
         libraries = DataManager.get_steam_libraries()
         total_libs = len(libraries)
 
         # Pre-load non-steam games mapping
-        self.progress.emit("Parsing Non-Steam shortcuts...")
+        self.progress.emit(0, 0, "Parsing Non-Steam shortcuts...")
         non_steam_games = NonSteamManager.get_non_steam_ids(STEAM_BASE)
 
-        self.progress.emit("Scanning manifest files...")
-        for lib_path in libraries:
-            apps_path = lib_path / "steamapps"
-            if apps_path.exists():
-                for acf in apps_path.glob("*.acf"):
-                    try:
-                        content = acf.read_text(encoding="utf-8", errors="ignore")
-                        aid_match = re.search(r'"appid"\s+"(\d+)"', content)
-                        name_match = re.search(r'"name"\s+"([^"]+)"', content)
-                        if aid_match:
-                            appid = aid_match.group(1)
-                            name = name_match.group(1) if name_match else f"AppID {appid}"
-                            installed_games[appid] = name
-                    except: continue
-
-        for idx, lib_path in enumerate(libraries):
-            self.progress.emit(f"Scanning Library {idx + 1}/{total_libs}: {lib_path.name}")
-
-            compatdata_path = lib_path / "steamapps" / "compatdata"
-
-            if not compatdata_path.exists():
-                continue
-
-            if not os.access(compatdata_path, os.R_OK | os.X_OK):
-                continue
-
-            try:
-                dirs = [d for d in compatdata_path.iterdir() if d.is_dir() and d.name.isdigit()]
-
-                for d in dirs:
-                    appid = d.name
-                    if appid in IGNORE_APPIDS: continue
-
-                    if not os.access(d, os.R_OK):
-                        continue
-
-                    display_name = "Unknown"
-                    is_installed = False
-
-                    if appid in custom_status:
-                        is_installed = custom_status[appid]
-                    elif appid in installed_games:
-                        is_installed = True
-                    elif appid in non_steam_games:
-                        is_installed = True
-
-                    status = "Installed" if is_installed else "Uninstalled"
-
-                    if appid in custom_names:
-                        display_name = custom_names[appid]
-                    elif appid in installed_games:
-                        display_name = installed_games[appid]
-                    elif appid in non_steam_games:
-                        display_name = non_steam_games[appid]
-                    elif appid in api_cache:
-                        display_name = api_cache[appid]
-                    else:
-                        fetched = self.fetch_steam_name(appid)
-                        display_name = fetched
-                        if "AppID" not in fetched:
-                            api_cache[appid] = fetched
-
-                    prefixes.append({
-                        "appid": appid,
-                        "name": display_name,
-                        "path": str(d),
-                        "status": status,
-                        "is_installed": is_installed
-                    })
-            except Exception as e:
-                print(f"Error scanning {compatdata_path}: {e}")
-
-        db["api_cache"] = api_cache
-        DataManager.save_db(db)
+        self.progress.emit(0, 0, "Scanning manifest files...")
+        installed_games = DataManager.get_installed_games(libraries)
+
+        # appid -> (display name, installed), built lowest priority first so later sources win.
+        # A name of None means unknown and is fetched after the sweep.
+        api_names = DataManager.load_api_names()
+        resolved = {aid: (name, False) for aid, (name, _) in api_names.items()}
+        for aid, name in non_steam_games.items():
+            resolved[aid] = (name, True)
+        for aid, name in installed_games.items():
+            resolved[aid] = (name, True)
+        for aid, name in custom_names.items():
+            resolved[aid] = (name, resolved.get(aid, (None, False))[1])
+        for aid, is_installed in custom_status.items():
+            resolved[aid] = (resolved.get(aid, (None, False))[0], is_installed)
+
+        # Expired cache entries still shown under their cached name; refreshed after the sweep
+        cutoff = int(time.time()) - API_CACHE_TTL
+        stale = {aid for aid, (_, fetched_at) in api_names.items()
+                 if fetched_at <= cutoff and aid not in non_steam_games
+                 and aid not in installed_games and aid not in custom_names}
+
+        self.progress.emit(0, 0, f"Scanning {total_libs} libraries...")
+        with ThreadPoolExecutor(max_workers=max(1, total_libs)) as executor:
+            # map() keeps library order, so the dedup below still prefers the first library
+            results = executor.map(lambda lib: self._scan_library(lib, resolved), libraries)
+            for idx, (lib_path, lib_prefixes) in enumerate(zip(libraries, results)):
+                self.progress.emit(idx + 1, total_libs, lib_path.name)
+                prefixes.extend(lib_prefixes)
+
+        unresolved = [p for p in prefixes if p["name"] is None or p["appid"] in stale]
+        if unresolved:
+            for p in prefixes:
+                if p["name"] is None:
+                    p["name"] = f"AppID {p['appid']}"
+            shown = {p["appid"]: p["name"] for p in unresolved}
+            # Copies, so names filled in below never race with the GUI reading them
+            self.partial.emit(self.finalize([dict(p) for p in prefixes]))
+
+            unknown_ids = list(shown)
+            self.progress.emit(0, 0, f"Fetching {len(unknown_ids)} names from Steam...")
+            with ThreadPoolExecutor(max_workers=min(NAME_FETCH_WORKERS, len(unknown_ids))) as executor:
+                fetched = dict(zip(unknown_ids, executor.map(self.fetch_steam_name, unknown_ids)))
+
+            # A failed lookup keeps whatever was shown: the expired cached name, or the placeholder
+            new_names = {aid: name for aid, name in fetched.items() if name != f"AppID {aid}"}
+            for p in unresolved:
+                p["name"] = new_names.get(p["appid"], p["name"])
+
+            if new_names:
+                DataManager.save_api_names(new_names)
+            self.names_resolved.emit({aid: (shown[aid], name) for aid, name in new_names.items()})
+
+        self.finished.emit(self.finalize(prefixes))
 
+    @staticmethod
+    def finalize(prefixes):
         unique_prefixes = {}
         for p in prefixes:
             aid = p["appid"]
@@ -816,18 +1229,84 @@ class ScanWorker(QThread):
                     unique_prefixes[aid] = p
 
         final_list = list(unique_prefixes.values())
-        final_list.sort(key=lambda x: (not x["is_installed"], x["name"].lower()))
-        self.finished.emit(final_list)
+        final_list.sort(key=ScanWorker.sort_key)
+        for p in final_list:
+            p["search_key"] = ScanWorker.search_key(p) # Built here, off the GUI thread
+        return final_list
+
+    @staticmethod
+    def sort_key(p):
+        return (not p["is_installed"], p["name"].lower())
+
+    @staticmethod
+    def search_key(p):
+        # Lowercased name and appid for filter_grid. The newline can't be typed
+        # into the search box, so no match spans the two.
+        return f"{p['name'].lower()}\n{p['appid']}"
+
+    @staticmethod
+    def _scan_library(lib_path, resolved):
+        prefixes = []
+        compatdata_path = lib_path / "steamapps" / "compatdata"
+
+        if not compatdata_path.exists():
+            return prefixes
+
+        if not os.access(compatdata_path, os.R_OK | os.X_OK):
+            return prefixes
+
+        try:
+            with os.scandir(compatdata_path) as it:
+                dirs = [e for e in it if e.name.isdigit() and e.is_dir()]
+
+            for d in dirs:
+                appid = d.name
+                if appid in IGNORE_APPIDS: continue
+
+                display_name, is_installed = resolved.get(appid, (None, False))
+                status = "Installed" if is_installed else "Uninstalled"
+
+                prefixes.append({
+                    "appid": appid,
+                    "name": display_name,
+                    "path": d.path,
+                    "status": status,
+                    "is_installed": is_installed
+                })
+        except Exception as e:
+            print(f"Error scanning {compatdata_path}: {e}")
+        return prefixes
 
-    def fetch_steam_name(self, appid):
+    @staticmethod
+    def fetch_steam_name(appid):
         try:
-            resp = requests.get(STEAM_API_URL, params={"appids": appid}, timeout=2)
+            return ScanWorker._fetch_steam_name_cached(appid)
+        except LookupError:
+            return f"AppID {appid}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _fetch_steam_name_cached(appid):
+        # Failures raise instead of returning, so lru_cache only keeps real names
+        try:
+            # "basic" still carries the name but skips screenshots, movies, pricing...
+            resp = _SESSION.get(STEAM_API_URL, params={"appids": appid, "filters": "basic"}, timeout=2)
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get(appid, {}).get("success"):
                     return data[appid]["data"]["name"]
         except: pass
-        return f"AppID {appid}"
+        raise LookupError(appid)
+
+class ReqCtx:
+    # Request metadata carried on QNetworkRequest.Attribute.User
+    __slots__ = ("appid", "name", "req_type", "retries")
+
+    def __init__(self, appid, name, req_type):
+        self.appid = appid
+        self.name = name
+        self.req_type = req_type
+        self.retries = 0
 
 class MainWindow(QMainWindow):
     REQ_TYPE_IMAGE = 1
@@ -835,6 +1314,20 @@ class MainWindow(QMainWindow):
     REQ_TYPE_FALLBACK = 3
     REQ_TYPE_MANUAL_URL = 4
 
+    NO_ERROR = QNetworkReply.NetworkError.NoError
+
+    # Worth another try: the server or the link hiccuped, the resource itself may be fine
+    TRANSIENT_ERRORS = frozenset({
+        QNetworkReply.NetworkError.RemoteHostClosedError,
+        QNetworkReply.NetworkError.TimeoutError,
+        QNetworkReply.NetworkError.OperationCanceledError, # Transfer timeout
+        QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+        QNetworkReply.NetworkError.ProxyTimeoutError,
+        QNetworkReply.NetworkError.InternalServerError,
+        QNetworkReply.NetworkError.ServiceUnavailableError,
+        QNetworkReply.NetworkError.UnknownServerError,
+    })
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PrefixHQ")
@@ -843,17 +1336,67 @@ class MainWindow(QMainWindow):
         DataManager.init_storage()
 
         self.nam = QNetworkAccessManager()
+        self.nam.setStrictTransportSecurityEnabled(True)
+        self.nam.setAutoDeleteReplies(True)
+        self.nam.setTransferTimeout(NETWORK_TIMEOUT_MS)
+        http_cache = QNetworkDiskCache(self.nam)
+        http_cache.setCacheDirectory(str(HTTP_CACHE_DIR))
+        http_cache.setMaximumCacheSize(HTTP_CACHE_SIZE)
+        self.nam.setCache(http_cache)
         self.nam.finished.connect(self.on_network_finished)
+        self._reply_handlers = {
+            self.REQ_TYPE_IMAGE: self.on_image_reply,
+            self.REQ_TYPE_SEARCH: self.on_search_reply,
+            self.REQ_TYPE_FALLBACK: self.on_fallback_reply,
+            self.REQ_TYPE_MANUAL_URL: self.on_manual_url_reply,
+        }
+
+        # Requests beyond NETWORK_MAX_IN_FLIGHT wait here instead of piling up inside Qt
+        self._request_queue = collections.deque()
+        self._in_flight = 0
 
         self.cards = {}
         self.all_prefixes = []
+        self._search_index = {} # appid -> lowercased "name\nappid", see filter_grid
+        self._last_filter = None # (text, matching appids) of the previous filter pass
+        self._shown = set() # appids of the cards not hidden by the filter
+
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(0)
+        self._relayout_timer.timeout.connect(lambda: self.scroll_content.adjustSize())
+
+        # In-memory DB, written back lazily by flush_db()
+        self.db = DataManager.load_db()
+        self._db_dirty = False
+        self._db_flush_timer = QTimer(self)
+        self._db_flush_timer.setSingleShot(True)
+        self._db_flush_timer.setInterval(DB_FLUSH_DELAY_MS)
+        self._db_flush_timer.timeout.connect(self.flush_db)
 
         # Load view mode preference
-        db = DataManager.load_db()
-        self.view_mode = db.get("view_mode", "grid") # Default to grid
+        self.view_mode = self.db.get("view_mode", "grid") # Default to grid
 
         self.active_downloads = set()
 
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self.show_scan_progress)
+
+        # Scaled covers live in QPixmapCache, bounded by PIX_CACHE_BYTES
+        QPixmapCache.setCacheLimit(PIX_CACHE_BYTES // 1024)
+        self._pix_keys = {} # appid -> cache keys inserted for it
+        self._image_cache_trimmed = False # Disk cache is trimmed once, after the first scan
+
+        self.image_signals = ImageLoadSignals()
+        self.image_signals.loaded.connect(self.on_image_loaded)
+
+        self.pending_deletes = set()
+        self.delete_signals = RemoveTreeSignals()
+        self.delete_signals.done.connect(self.on_delete_finished)
+
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
         self.main_layout = QVBoxLayout(main_widget)
@@ -892,7 +1435,8 @@ class MainWindow(QMainWindow):
         footer_layout.addWidget(self.exit_btn)
         self.main_layout.addWidget(footer_widget)
 
-        self.refresh_data()
+        # Start scanning once the event loop is running, so the window paints first
+        QTimer.singleShot(0, self.refresh_data)
 
     def close_application(self):
         if self.active_downloads:
@@ -909,8 +1453,23 @@ class MainWindow(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.No: return
 
+        self.flush_db()
         QApplication.quit()
 
+    def closeEvent(self, event):
+        self.flush_db()
+        super().closeEvent(event)
+
+    def schedule_db_flush(self):
+        self._db_dirty = True
+        self._db_flush_timer.start()
+
+    def flush_db(self):
+        self._db_flush_timer.stop()
+        if self._db_dirty:
+            DataManager.save_db(self.db)
+            self._db_dirty = False
+
     def setup_header(self):
         header = QHBoxLayout()
 
@@ -920,7 +1479,12 @@ class MainWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search games...")
         self.search_input.setFixedWidth(300)
-        self.search_input.textChanged.connect(self.filter_grid)
+        # Debounced: a burst of keystrokes runs one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(lambda: self.filter_grid(self.search_input.text()))
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
 
         self.btn_toggle_view = QPushButton()
         self.btn_toggle_view.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -946,31 +1510,23 @@ class MainWindow(QMainWindow):
         self.main_layout.addLayout(header)
 
     def update_toggle_btn_icon(self):
-        style = QApplication.style()
         if self.view_mode == "grid":
-            icon = QIcon.fromTheme("view-list")
-            if icon.isNull():
-                icon = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogListView)
-            self.btn_toggle_view.setIcon(icon)
+            self.btn_toggle_view.setIcon(cached_icon(QStyle.StandardPixmap.SP_FileDialogListView, "view-list"))
         else:
-            icon = QIcon.fromTheme("view-grid")
-            if icon.isNull():
-                icon = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
-            self.btn_toggle_view.setIcon(icon)
+            self.btn_toggle_view.setIcon(cached_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView, "view-grid"))
 
     def toggle_view(self):
         self.view_mode = "list" if self.view_mode == "grid" else "grid"
 
         # Save view mode to DB
-        db = DataManager.load_db()
-        db["view_mode"] = self.view_mode
-        DataManager.save_db(db)
+        if self.db.get("view_mode") != self.view_mode:
+            self.db["view_mode"] = self.view_mode
+            self.schedule_db_flush()
 
         self.update_toggle_btn_icon()
-        self.setup_view_container()
         self.populate_view()
 
-    def setup_view_container(self):
+    def setup_view_container(self, attach=True):
         self.scroll_content = QWidget()
 
         if self.view_mode == "grid":
@@ -979,174 +1535,343 @@ class MainWindow(QMainWindow):
             self.layout_container = QVBoxLayout(self.scroll_content)
             self.layout_container.setSpacing(5)
             self.layout_container.setContentsMargins(5, 5, 5, 5)
-            self.layout_container.addStretch() # Push items to top
 
         self.scroll_content.setLayout(self.layout_container)
-        self.scroll_area.setWidget(self.scroll_content)
+        if attach:
+            self.scroll_area.setWidget(self.scroll_content) # Deletes the previous container and its cards
 
     def refresh_data(self):
         self.btn_refresh.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
 
-        self.worker = ScanWorker()
-        self.worker.progress.connect(lambda s: self.status_label.setText(s))
+        self._scan_partial = False
+        self.worker = ScanWorker(self.db)
+        self.worker.progress.connect(self.on_scan_progress)
+        self.worker.partial.connect(self.on_scan_partial)
+        self.worker.names_resolved.connect(self.on_names_resolved)
         self.worker.finished.connect(self.on_scan_finished)
         self.worker.start()
 
+    def on_scan_progress(self, current, total, text):
+        # Only the latest update is kept; the label is refreshed at most every PROGRESS_INTERVAL_MS
+        self._pending_progress = (current, total, text)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def show_scan_progress(self):
+        if self._pending_progress is None: return
+        current, total, text = self._pending_progress
+        self._pending_progress = None
+        self.status_label.setText(f"Scanned Library {current}/{total}: {text}" if total else text)
+
+    def on_scan_partial(self, prefixes):
+        # Cards go up straight after the disk sweep; unknown names show their AppID for now
+        self._scan_partial = True
+        self.all_prefixes = prefixes
+        self.populate_view()
+
+    def on_names_resolved(self, names):
+        for appid, (shown, name) in names.items():
+            card = self.cards.get(appid)
+            # Only the name the partial scan showed is replaced; a rename made meanwhile wins
+            if not card or card.data["name"] != shown or name == shown: continue
+            card.data["name"] = name
+            card.title_lbl.setText(name)
+            self.update_search_index(appid)
+            # The first attempt had no name to fall back on; give a missing cover another go
+            if card.img_label.pixmap().isNull() and appid not in self.active_downloads:
+                self.load_image(appid, name)
+
     def on_scan_finished(self, prefixes):
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_bar.setVisible(False)
         self.btn_refresh.setEnabled(True)
         self.status_label.setText(f"Found {len(prefixes)} prefixes.")
-        self.all_prefixes = prefixes
-        self.populate_view()
+        if not self._image_cache_trimmed:
+            self._image_cache_trimmed = True
+            in_use = frozenset(p["appid"] for p in prefixes)
+            QThreadPool.globalInstance().start(lambda: DataManager.trim_image_cache(in_use))
+        if self._scan_partial:
+            # Same prefixes as the partial result, already patched in place (and possibly
+            # edited since); only the order can be stale now that names are known
+            self.all_prefixes.sort(key=ScanWorker.sort_key)
+            self.reorder_view()
+            self.filter_grid(self.search_input.text()) # Resolved names may match the search now
+        else:
+            self.all_prefixes = prefixes
+            self.populate_view()
+
+    def reorder_view(self):
+        # Moves the existing widgets into all_prefixes order, without rebuilding them
+        self.scroll_content.setUpdatesEnabled(False)
+        self.relayout_cards()
+        self.scroll_content.setUpdatesEnabled(True)
+
+    def relayout_cards(self):
+        # Items are taken from the back, so FlowLayout never shifts its list, and re-added
+        # as plain items: addWidget would first scan the layout for each card (O(n^2)).
+        # Cards are already children of the container; filter_grid shows them.
+        layout = self.layout_container
+        for i in reversed(range(layout.count())):
+            layout.takeAt(i)
+        for p in self.all_prefixes:
+            card = self.cards.get(p["appid"])
+            if card: layout.addItem(QWidgetItem(card))
+        if self.view_mode == "list":
+            layout.addStretch() # Push items to top
+        layout.invalidate()
 
     def populate_view(self):
+        card_cls = GameCard if self.view_mode == "grid" else GameListItem
+        pool = self.cards
         self.cards = {}
 
-        if self.layout_container:
-            while self.layout_container.count():
-                item = self.layout_container.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+        # Same view type: the container and the cards of appids still present are reused.
+        # Otherwise cards are built into a fresh, detached container that is swapped in at
+        # the end, so nothing is laid out or painted mid-build and the old cards go in one delete.
+        reuse = bool(pool) and type(next(iter(pool.values()))) is card_cls
+        if reuse:
+            self.scroll_content.setUpdatesEnabled(False)
+        else:
+            pool = {}
+            self.setup_view_container(attach=False)
 
         for p in self.all_prefixes:
-            if self.view_mode == "grid":
-                widget = GameCard(p, self)
+            widget = pool.pop(p["appid"], None)
+            if widget is None:
+                widget = card_cls(p, self.scroll_content)
             else:
-                widget = GameListItem(p, self)
-
-            self.layout_container.addWidget(widget)
+                widget.update_data(p)
             self.cards[p["appid"]] = widget
             self.load_image(p["appid"], p["name"])
 
-        if self.view_mode == "list":
-            self.layout_container.addStretch()
+        self.relayout_cards()
+        for card in pool.values(): # Prefixes that are gone
+            card.hide()
+            card.deleteLater()
 
+        self._search_index = {appid: card.data["search_key"] for appid, card in self.cards.items()}
+        self._last_filter = None
+        self._shown = {appid for appid, card in self.cards.items() if not card.isHidden()}
         self.filter_grid(self.search_input.text())
 
+        if reuse:
+            self.scroll_content.setUpdatesEnabled(True)
+        else:
+            self.scroll_area.setWidget(self.scroll_content)
+
+    def update_search_index(self, appid):
+        if appid in self.cards:
+            data = self.cards[appid].data
+            data["search_key"] = ScanWorker.search_key(data)
+            self._search_index[appid] = data["search_key"]
+        else:
+            self._search_index.pop(appid, None)
+        self._last_filter = None
+
     def filter_grid(self, text):
         text = text.lower()
-        visible_count = 0
-        for appid, card in self.cards.items():
-            match = text in card.data["name"].lower() or text in str(appid)
-            card.setVisible(match)
-            if match: visible_count += 1
+        index = self._search_index
+
+        if not text:
+            matches = set(index)
+        else:
+            # A query containing the previous one can only match a subset of its results
+            candidates = index.keys()
+            if self._last_filter and self._last_filter[0] in text:
+                candidates = self._last_filter[1]
+            matches = {appid for appid in candidates if text in index[appid]}
+        self._last_filter = (text, matches)
+
+        # Only cards whose state flips are touched, not every card on every keystroke
+        to_hide = self._shown - matches
+        to_show = matches - self._shown
+        self._shown = matches
+        if not (to_hide or to_show): return
+
+        self.scroll_content.setUpdatesEnabled(False) # One repaint for the whole batch
+        for appid in to_hide:
+            if appid in self.cards: self.cards[appid].setVisible(False)
+        for appid in to_show:
+            self.cards[appid].setVisible(True)
+        self.scroll_content.setUpdatesEnabled(True)
 
         if self.view_mode == "grid":
-            self.scroll_content.adjustSize()
+            self._relayout_timer.start() # One adjustSize for a burst of keystrokes
 
     # --- IMAGE HANDLING ---
-    def load_image(self, appid, name):
-        cache_path = IMG_CACHE_DIR / f"{appid}.jpg"
+    def image_size(self):
+        # Physical pixels, so covers stay sharp on HiDPI screens
+        size = GRID_IMAGE_SIZE if self.view_mode == "grid" else LIST_IMAGE_SIZE
+        return size * self.devicePixelRatioF()
+
+    def start_image_task(self, appid, path=None, data=None):
+        QThreadPool.globalInstance().start(ImageLoadTask(self.image_signals, appid, self.image_size(), path, data))
+
+    def load_image(self, appid, name, force=False):
+        size = self.image_size()
+        card = self.cards.get(appid)
+        if not force and card and card.img_label.pixmap().size() == size:
+            return # Reused card already shows a cover at this size
+        pix = QPixmapCache.find(self.pixmap_key(appid, size))
+        if pix is not None:
+            if appid in self.cards:
+                self.cards[appid].update_image(pix)
+            return
 
+        thumb_path = ImageLoadTask.thumb_path(appid, size)
+        if thumb_path.exists():
+            self.start_image_task(appid, path=thumb_path)
+            return
+
+        cache_path = IMG_CACHE_DIR / f"{appid}.jpg"
         if cache_path.exists():
-            pix = QPixmap(str(cache_path))
-            if not pix.isNull():
-                if appid in self.cards:
-                    self.cards[appid].update_image(pix)
-                return
+            self.start_image_task(appid, path=cache_path)
+            return
 
         if appid in self.active_downloads: return
 
         url = STEAM_IMG_URL.format(appid=appid)
-        req = QNetworkRequest(QUrl(url))
-        data = {
-            "appid": appid,
-            "name": name,
-            "req_type": self.REQ_TYPE_IMAGE
-        }
-        req.setAttribute(QNetworkRequest.Attribute.User, data)
-        self.nam.get(req)
+        req = self.make_request(url, QNetworkRequest.CacheLoadControl.PreferCache) # Static CDN file
+        req.setAttribute(QNetworkRequest.Attribute.User, ReqCtx(appid, name, self.REQ_TYPE_IMAGE))
+        self.enqueue_request(req)
         self.active_downloads.add(appid)
 
-    def on_network_finished(self, reply):
-        user_data = reply.request().attribute(QNetworkRequest.Attribute.User)
-        if not isinstance(user_data, dict):
-             reply.deleteLater()
-             return
+    @staticmethod
+    def make_request(url, load_control=QNetworkRequest.CacheLoadControl.PreferNetwork):
+        req = QNetworkRequest(QUrl(url))
+        # One multiplexed connection per host
+        req.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        req.setAttribute(QNetworkRequest.Attribute.HttpPipeliningAllowedAttribute, True) # Used if HTTP/2 is refused
+        req.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, load_control)
+        return req
 
-        appid = user_data.get("appid")
-        name = user_data.get("name")
-        req_type = user_data.get("req_type")
+    def enqueue_request(self, req):
+        self._request_queue.append(req)
+        self.drain_requests()
 
-        if req_type == self.REQ_TYPE_IMAGE:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                self.save_and_display_image(appid, reply.readAll())
+    def drain_requests(self):
+        while self._request_queue and self._in_flight < NETWORK_MAX_IN_FLIGHT:
+            self.nam.get(self._request_queue.popleft())
+            self._in_flight += 1
+
+    def on_network_finished(self, reply):
+        self._in_flight -= 1
+        req = reply.request()
+        ctx = req.attribute(QNetworkRequest.Attribute.User)
+        if isinstance(ctx, ReqCtx):
+            err = reply.error()
+            if err in self.TRANSIENT_ERRORS and ctx.retries < NETWORK_RETRIES:
+                # Backed-off retry before the handler gives up on it; the request carries ctx along
+                delay = min(NETWORK_RETRY_DELAY_MS * 2 ** ctx.retries, NETWORK_RETRY_MAX_DELAY_MS)
+                ctx.retries += 1
+                QTimer.singleShot(delay, lambda: self.enqueue_request(req))
             else:
-                if name and "AppID" not in name:
-                    self.start_fallback_search(appid, name)
-                else:
-                    self.active_downloads.discard(appid)
+                self._reply_handlers[ctx.req_type](ctx, reply, err == self.NO_ERROR)
+        self.drain_requests()
 
-        elif req_type == self.REQ_TYPE_SEARCH:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                try:
-                    data = json.loads(reply.readAll().data().decode())
-                    if data.get("total", 0) > 0 and data.get("items"):
-                        found_id = data["items"][0]["id"]
-                        self.start_fallback_download(appid, found_id)
-                    else:
-                        self.active_downloads.discard(appid)
-                except:
-                    self.active_downloads.discard(appid)
+    def on_image_reply(self, ctx, reply, ok):
+        appid = ctx.appid
+        if ok:
+            self.save_and_display_image(appid, reply.readAll())
+        else:
+            name = ctx.name
+            if appid in self.cards:
+                name = self.cards[appid].data["name"] # May have been resolved since the request went out
+            if name and "AppID" not in name:
+                self.start_fallback_search(appid, name)
             else:
                 self.active_downloads.discard(appid)
 
-        elif req_type == self.REQ_TYPE_FALLBACK:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                self.save_and_display_image(appid, reply.readAll())
-            self.active_downloads.discard(appid)
+    def on_search_reply(self, ctx, reply, ok):
+        appid = ctx.appid
+        if ok:
+            try:
+                raw = reply.readAll().data()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                if data.get("total", 0) > 0 and data.get("items"):
+                    found_id = data["items"][0]["id"]
+                    self.start_fallback_download(appid, found_id)
+                    return
+            except (ValueError, AttributeError, KeyError, IndexError, TypeError):
+                pass # Malformed or unexpected search response (JSONDecodeError is a ValueError)
+        self.active_downloads.discard(appid)
 
-        elif req_type == self.REQ_TYPE_MANUAL_URL:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                self.save_and_display_image(appid, reply.readAll())
-            else:
-                QMessageBox.warning(self, "Download Error", "Could not download image from provided URL.")
-            self.active_downloads.discard(appid)
+    def on_fallback_reply(self, ctx, reply, ok):
+        if ok:
+            self.save_and_display_image(ctx.appid, reply.readAll())
+        else:
+            self.active_downloads.discard(ctx.appid)
 
-        reply.deleteLater()
+    def on_manual_url_reply(self, ctx, reply, ok):
+        if ok:
+            self.save_and_display_image(ctx.appid, reply.readAll())
+        else:
+            self.active_downloads.discard(ctx.appid)
+            QMessageBox.warning(self, "Download Error", "Could not download image from provided URL.")
 
     def start_fallback_search(self, appid, name):
-        url = STEAM_SEARCH_URL.format(term=name)
-        req = QNetworkRequest(QUrl(url))
-        data = {
-            "appid": appid,
-            "name": name,
-            "req_type": self.REQ_TYPE_SEARCH
-        }
-        req.setAttribute(QNetworkRequest.Attribute.User, data)
-        self.nam.get(req)
+        url = STEAM_SEARCH_URL.format(term=quote(name)) # "&" or "#" in a name would cut the query short
+        req = self.make_request(url)
+        req.setAttribute(QNetworkRequest.Attribute.User, ReqCtx(appid, name, self.REQ_TYPE_SEARCH))
+        self.enqueue_request(req)
 
     def start_fallback_download(self, original_appid, found_appid):
         url = STEAM_IMG_URL.format(appid=found_appid)
-        req = QNetworkRequest(QUrl(url))
-        data = {
-            "appid": original_appid,
-            "req_type": self.REQ_TYPE_FALLBACK
-        }
-        req.setAttribute(QNetworkRequest.Attribute.User, data)
-        self.nam.get(req)
+        req = self.make_request(url, QNetworkRequest.CacheLoadControl.PreferCache)
+        req.setAttribute(QNetworkRequest.Attribute.User, ReqCtx(original_appid, None, self.REQ_TYPE_FALLBACK))
+        self.enqueue_request(req)
 
     def save_and_display_image(self, appid, data):
-        self.active_downloads.discard(appid)
-        pix = QPixmap()
-        pix.loadFromData(data)
+        # Validated, written to the cache and displayed by ImageLoadTask. The appid stays
+        # in active_downloads until on_image_loaded, so nothing refetches it mid-decode.
+        self.active_downloads.add(appid)
+        self.start_image_task(appid, data=data) # QByteArray from the reply, shared rather than copied
 
-        if not pix.isNull():
-            try:
-                with open(IMG_CACHE_DIR / f"{appid}.jpg", "wb") as f:
-                    f.write(data)
-            except: pass
+    def on_image_loaded(self, appid, image, from_disk):
+        if not from_disk:
+            self.active_downloads.discard(appid)
+        card = self.cards.get(appid)
+        if not card: return
 
-            if appid in self.cards:
-                self.cards[appid].update_image(pix)
+        if image.isNull():
+            if from_disk:
+                self.load_image(appid, card.data["name"], force=True) # Broken cache file was removed, try the next source
+            return
+
+        # Results for the other view mode arrive after a toggle; that view reloads its own
+        if image.size() != self.image_size(): return
+
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(self.devicePixelRatioF())
+        card.update_image(pix)
+        self.cache_pixmap(appid, pix, replace_all=not from_disk)
+
+    @staticmethod
+    def pixmap_key(appid, size):
+        return f"cover:{appid}:{size.width()}x{size.height()}"
+
+    def cache_pixmap(self, appid, pix, replace_all=False):
+        if replace_all:
+            self.drop_cached_pixmaps(appid) # New cover: the cached sizes of the old one are all stale
+
+        key = self.pixmap_key(appid, pix.size())
+        QPixmapCache.insert(key, pix)
+        self._pix_keys.setdefault(appid, set()).add(key)
+
+    def drop_cached_pixmaps(self, appid):
+        for key in self._pix_keys.pop(appid, ()):
+            QPixmapCache.remove(key)
 
     # --- ACTIONS ---
     def action_open(self, data):
         path = Path(data["path"])
         if path.exists():
+            if not os.access(path, os.R_OK | os.X_OK):
+                QMessageBox.critical(self, "Permission Denied", "Cannot open this prefix. Access denied.")
+                return
             if not SystemUtils.open_with_file_manager(path):
                 QMessageBox.warning(self, "Error", "Could not open file manager.")
         else:
@@ -1166,22 +1891,24 @@ class MainWindow(QMainWindow):
         new_name, ok = QInputDialog.getText(self, "Rename", f"Rename {data['name']}:", text=data["name"])
         if ok and new_name.strip():
             new_name = new_name.strip()
-            db = DataManager.load_db()
-            db.setdefault("custom_names", {})[data["appid"]] = new_name
-            DataManager.save_db(db)
+            if new_name == data["name"]: return # Dialog accepted unchanged
+            self.db.setdefault("custom_names", {})[data["appid"]] = new_name
+            self.schedule_db_flush()
 
             data["name"] = new_name
             if data["appid"] in self.cards:
                 self.cards[data["appid"]].title_lbl.setText(new_name)
+                self.update_search_index(data["appid"])
                 self.load_image(data["appid"], new_name)
 
     def action_toggle_status(self, data):
         current_status = data["is_installed"]
         new_status = not current_status
 
-        db = DataManager.load_db()
-        db.setdefault("custom_status", {})[data["appid"]] = new_status
-        DataManager.save_db(db)
+        custom_status = self.db.setdefault("custom_status", {})
+        if custom_status.get(data["appid"]) != new_status:
+            custom_status[data["appid"]] = new_status
+            self.schedule_db_flush()
 
         data["is_installed"] = new_status
         data["status"] = "Installed" if new_status else "Uninstalled"
@@ -1190,6 +1917,7 @@ class MainWindow(QMainWindow):
             self.cards[data["appid"]].update_status_display()
 
     def action_delete(self, data):
+        if data["appid"] in self.pending_deletes: return
         path = Path(data["path"])
 
         if not path.exists():
@@ -1204,18 +1932,34 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(self, "Delete", msg, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                shutil.rmtree(data["path"])
-                if data["appid"] in self.cards:
-                    card = self.cards.pop(data["appid"])
-                    card.deleteLater()
-                    QTimer.singleShot(10, lambda: self.scroll_content.adjustSize())
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete: {e}")
+            self.pending_deletes.add(data["appid"])
+            if data["appid"] in self.cards:
+                self.cards[data["appid"]].setEnabled(False) # Until the delete reports back
+            QThreadPool.globalInstance().start(RemoveTreeTask(self.delete_signals, data["appid"], data["path"]))
+
+    def on_delete_finished(self, appid, ok, err):
+        self.pending_deletes.discard(appid)
+        if not ok:
+            if appid in self.cards:
+                self.cards[appid].setEnabled(True)
+            QMessageBox.critical(self, "Error", f"Failed to delete: {err}")
+            return
+
+        self.drop_cached_pixmaps(appid)
+        if appid in self.cards:
+            card = self.cards.pop(appid)
+            self.update_search_index(appid)
+            card.deleteLater()
+            self._relayout_timer.start() # Shared, so a burst of deletes resizes once
 
     def action_set_cover_local(self, data):
-        fname, _ = QFileDialog.getOpenFileName(self, "Select Cover Art", "", "Images (*.png *.jpg *.jpeg *.bmp *.webp)")
+        start_dir = self.db.get("last_cover_dir", str(Path.home()))
+        fname, _ = QFileDialog.getOpenFileName(self, "Select Cover Art", start_dir, "Images (*.png *.jpg *.jpeg *.bmp *.webp)")
         if fname:
+            cover_dir = str(Path(fname).parent)
+            if self.db.get("last_cover_dir") != cover_dir:
+                self.db["last_cover_dir"] = cover_dir
+                self.schedule_db_flush()
             try:
                 with open(fname, "rb") as f:
                     img_data = f.read()
@@ -1228,13 +1972,10 @@ class MainWindow(QMainWindow):
         if dlg.exec() == QDialog.DialogCode.Accepted:
             url = dlg.get_url()
             if url:
-                req = QNetworkRequest(QUrl(url))
-                req_data = {
-                    "appid": data["appid"],
-                    "req_type": self.REQ_TYPE_MANUAL_URL
-                }
-                req.setAttribute(QNetworkRequest.Attribute.User, req_data)
-                self.nam.get(req)
+                # The user may be re-fetching an image that changed behind the same URL
+                req = self.make_request(url, QNetworkRequest.CacheLoadControl.AlwaysNetwork)
+                req.setAttribute(QNetworkRequest.Attribute.User, ReqCtx(data["appid"], None, self.REQ_TYPE_MANUAL_URL))
+                self.enqueue_request(req)
                 self.active_downloads.add(data["appid"])
 
 if __name__ == "__main__":
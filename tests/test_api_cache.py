@@ -0,0 +1,65 @@
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# PrefixHQ resolves its Steam and config paths at import time
+_HOME = tempfile.mkdtemp(prefix="prefixhq-test-")
+os.environ["HOME"] = _HOME
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import PrefixHQ as P
+
+
+class ExpiredApiCacheTest(unittest.TestCase):
+    def setUp(self):
+        P.DataManager.init_storage()
+        P.CACHE_DB_FILE.unlink(missing_ok=True)
+        for appid in ("555", "556"):
+            (P.COMPATDATA / appid / "pfx").mkdir(parents=True, exist_ok=True)
+
+        self.expired = int(time.time()) - P.API_CACHE_TTL - 60
+        P.DataManager._write_api_cache([
+            ("555", "Delisted Game", self.expired),
+            ("556", "Old Name", self.expired),
+        ])
+
+        self._fetch = P.ScanWorker.fetch_steam_name
+        P.ScanWorker.fetch_steam_name = staticmethod(
+            lambda appid: "New Name" if appid == "556" else f"AppID {appid}")
+
+    def tearDown(self):
+        P.ScanWorker.fetch_steam_name = self._fetch
+
+    def scan(self):
+        worker = P.ScanWorker({})
+        result, resolved = [], []
+        worker.finished.connect(result.extend)
+        worker.names_resolved.connect(resolved.append)
+        worker.run() # Synchronously, on this thread
+        return {p["appid"]: p["name"] for p in result}, resolved
+
+    def cached_rows(self):
+        with sqlite3.connect(P.CACHE_DB_FILE) as conn:
+            return {appid: (name, ts) for appid, name, ts in conn.execute("SELECT * FROM api_cache")}
+
+    def test_failed_refresh_keeps_cached_name(self):
+        names, _ = self.scan()
+        self.assertEqual(names["555"], "Delisted Game")
+        self.assertEqual(self.cached_rows()["555"], ("Delisted Game", self.expired))
+
+    def test_successful_refresh_updates_name_and_timestamp(self):
+        names, resolved = self.scan()
+        self.assertEqual(names["556"], "New Name")
+        self.assertEqual(resolved, [{"556": ("Old Name", "New Name")}])
+        name, fetched_at = self.cached_rows()["556"]
+        self.assertEqual(name, "New Name")
+        self.assertGreater(fetched_at, int(time.time()) - P.API_CACHE_TTL)
+
+
+if __name__ == "__main__":
+    unittest.main()